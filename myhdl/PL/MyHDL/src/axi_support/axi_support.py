@@ -90,10 +90,10 @@ def axi_support(
         S_AXI_RRESP.next = axi_rresp
         S_AXI_RVALID.next = axi_rvalid
 
-    # Implement axi_awready generation
+    # Implement axi_awready generation and axi_awaddr latching
     # axi_awready is asserted for one S_AXI_ACLK clock cycle when both
-    # S_AXI_AWVALID and S_AXI_WVALID are asserted. axi_awready is
-    # de-asserted when reset is low.
+    # S_AXI_AWVALID and S_AXI_WVALID are asserted, and the address is
+    # latched in the same cycle. axi_awready is de-asserted when reset is low.
 
     @always_seq(S_AXI_ACLK.posedge, reset=S_AXI_ARESETN)
     def axi_awready_generation():
@@ -102,30 +102,16 @@ def axi_support(
             # on the write address and data bus. This design expects no
             # outstanding transactions.
             axi_awready.next = True
+            axi_awaddr.next = S_AXI_AWADDR
         else:
             axi_awready.next = False
 
-    # Implement axi_awaddr latching
-    # This process is used to latch the address when both
-    # S_AXI_AWVALID and S_AXI_WVALID are valid.
-    @always_seq(S_AXI_ACLK.posedge, reset=S_AXI_ARESETN)
-    def axi_awaddr_latching():
-        if (not axi_awready) and S_AXI_AWVALID and S_AXI_WVALID:
-            axi_awaddr.next = S_AXI_AWADDR
-
     # Implement axi_wready generation
-    # axi_wready is asserted for one S_AXI_ACLK clock cycle when both
-    # S_AXI_AWVALID and S_AXI_WVALID are asserted. axi_wready is
-    # de-asserted when reset is low.
-    @always_seq(S_AXI_ACLK.posedge, reset=S_AXI_ARESETN)
+    # Write address and write data are accepted in the same cycle, so
+    # axi_wready simply follows axi_awready.
+    @always_comb
     def axi_wready_generation():
-        if (not axi_awready) and S_AXI_AWVALID and S_AXI_WVALID:
-            # slave is ready to accept write data when there is a valid
-            # write address and write data on the write address and data
-            # bus. This design expects no outstanding transactions.
-            axi_wready.next = True
-        else:
-            axi_wready.next = False
+        axi_wready.next = axi_awready
 
     # Implement write response logic generation
     # The write response and response valid signals are asserted by the slave
@@ -210,15 +196,19 @@ def axi_connect(clk, resetn, axi_lite, axi_local, ADDR_WIDTH=12, DATA_WIDTH=32):
                        axi_lite.rresp, axi_lite.rvalid, axi_lite.rready, axi_awaddr, axi_araddr, reg_data,
                        DATA_WIDTH, ADDR_WIDTH)
 
+    # Register index of the latched addresses
+    axi_waddr_index = axi_awaddr(ADDR_LSB + OPT_MEM_ADDR_BITS, ADDR_LSB)
+    axi_raddr_index = axi_araddr(ADDR_LSB + OPT_MEM_ADDR_BITS, ADDR_LSB)
+
     @always_comb
     def axi_helpers():
         axi_lite.awready.next = axi_awready
         axi_lite.wready.next = axi_wready
-        axi_local.wen.next = axi_wready and axi_lite.awvalid and axi_awready and axi_lite.wvalid
-        axi_local.raddr.next = axi_araddr[
-            ADDR_LSB + OPT_MEM_ADDR_BITS:ADDR_LSB]
-        axi_local.waddr.next = axi_awaddr[
-            ADDR_LSB + OPT_MEM_ADDR_BITS:ADDR_LSB]
+        # axi_awready and axi_wready are only asserted while the master holds
+        # S_AXI_AWVALID and S_AXI_WVALID, so they alone qualify the write
+        axi_local.wen.next = axi_wready and axi_awready
+        axi_local.raddr.next = axi_raddr_index
+        axi_local.waddr.next = axi_waddr_index
         axi_local.wdata.next = axi_lite.wdata
         axi_local.wstrobe.next = axi_lite.wstrb
         reg_data.next = axi_local.rdata
@@ -0,0 +1 @@
+# Build support package
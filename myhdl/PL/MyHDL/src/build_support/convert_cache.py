@@ -0,0 +1,69 @@
+#!/usr/bin/python
+#
+# FILE:
+#   convert_cache.py
+#
+# DESCRIPTION:
+#   Caches MyHDL to Verilog conversion output, keyed on a hash of the MyHDL
+#   sources and the conversion parameters, so unchanged designs are not
+#   elaborated and converted again.
+#
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import myhdl
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+CACHE_DIR = Path("build") / "cache"
+
+
+def _digest(params, convert_args):
+    # Hash every MyHDL source file together with the parameters the
+    # generated HDL depends on
+    h = hashlib.blake2b(digest_size=16)
+    h.update(myhdl.__version__.encode())
+    for src in sorted(SRC_DIR.rglob("*.py")):
+        h.update(src.relative_to(SRC_DIR).as_posix().encode())
+        h.update(src.read_bytes())
+    h.update(repr(tuple(params)).encode())
+    h.update(repr(sorted(convert_args.items())).encode())
+    return h.hexdigest()
+
+
+def convert_cached(block_fn, block_args, params=(), cache_dir=CACHE_DIR, **convert_args):
+    """
+    Parameters:
+    block_fn      Top-level block to convert
+    block_args    Dictionary of arguments used to instantiate block_fn
+    params        Parameters the generated Verilog depends on, added to the cache key
+    cache_dir     Directory holding cached conversion output
+    convert_args  Arguments passed on to .convert(hdl="Verilog", ...)
+
+    Returns the paths of the Verilog files written to the output directory.
+    """
+    out_dir = Path(convert_args.pop("path", "."))
+    name = convert_args.get("name", block_fn.__name__)
+    outputs = [name + ".v"]
+    if convert_args.get("testbench", True):
+        outputs.append("tb_" + name + ".v")
+
+    entry = Path(cache_dir) / _digest(params, convert_args)
+    if not all((entry / f).is_file() for f in outputs):
+        block_fn(**block_args).convert(hdl="Verilog", path=str(out_dir), **convert_args)
+        # Populate the cache entry under a temporary name and rename it into
+        # place so an interrupted run never leaves a partial entry behind
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=cache_dir))
+        for f in outputs:
+            shutil.copy2(out_dir / f, tmp / f)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+    else:
+        # Copy without metadata so the outputs are newer than the sources
+        for f in outputs:
+            shutil.copyfile(entry / f, out_dir / f)
+
+    return [out_dir / f for f in outputs]
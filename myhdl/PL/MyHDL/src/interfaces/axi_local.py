@@ -5,7 +5,9 @@
 #
 # DESCRIPTION: Defines interface for AXI bus
 #
-from myhdl import (modbv, Signal)
+from myhdl import Signal
+
+from PL.MyHDL.src.interfaces.signal_types import modbv_type
 
 LOW, HIGH = bool(0), bool(1)
 
@@ -13,9 +15,9 @@ LOW, HIGH = bool(0), bool(1)
 class AxiLocal(object):
 
     def __init__(self, ADDR_WIDTH=12, DATA_WIDTH=32):
-        self.waddr = Signal(modbv(0)[ADDR_WIDTH:0])
-        self.wdata = Signal(modbv(0)[DATA_WIDTH:0])
-        self.wstrobe = Signal(modbv(0)[(DATA_WIDTH // 8):])
+        self.waddr = Signal(modbv_type(ADDR_WIDTH))
+        self.wdata = Signal(modbv_type(DATA_WIDTH))
+        self.wstrobe = Signal(modbv_type(DATA_WIDTH // 8))
         self.wen = Signal(LOW)
-        self.raddr = Signal(modbv(0)[ADDR_WIDTH:0])
-        self.rdata = Signal(modbv(0)[DATA_WIDTH:0])
+        self.raddr = Signal(modbv_type(ADDR_WIDTH))
+        self.rdata = Signal(modbv_type(DATA_WIDTH))
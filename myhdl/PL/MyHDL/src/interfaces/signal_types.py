@@ -0,0 +1,17 @@
+#!/usr/bin/python
+#
+# FILE:
+#   signal_types.py
+#
+# DESCRIPTION: Cached bit vector templates for interface signals
+#
+from functools import lru_cache
+
+from myhdl import modbv
+
+
+@lru_cache(maxsize=None)
+def modbv_type(width):
+    # Signal() copies its initial value, so one template per width can be
+    # shared by every interface instance
+    return modbv(0)[width:]
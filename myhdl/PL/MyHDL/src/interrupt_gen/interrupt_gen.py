@@ -21,16 +21,26 @@
 
 
 from myhdl import (
+    always,
     always_comb,
     always_seq,
     block,
+    ConcatSignal,
     instances,
     intbv,
     modbv,
     ResetSignal,
     Signal,
 )
+from PL.MyHDL.src.build_support.convert_cache import convert_cached
 from PL.MyHDL.src.interfaces.axi_local import AxiLocal
+from PL.MyHDL.src.register_support.register_support import (
+    register_read,
+    register_write,
+    REG_RW,
+    REG_W1C,
+    REG_WO_AUTOCLEAR,
+)
 
 PL_ADDR_WIDTH = 12
 PL_DATA_WIDTH = 32
@@ -42,6 +52,10 @@ INTERRUPT_GEN_PERIOD2 = 1
 INTERRUPT_GEN_ISR = 2
 INTERRUPT_GEN_IER = 3
 INTERRUPT_GEN_TRIGGER = 4
+INTERRUPT_GEN_NUM_REGS = 5
+# The period registers of the interrupts occupy consecutive indices from
+# INTERRUPT_GEN_PERIOD1
+INTERRUPT_GEN_NUM_INTERRUPTS = 2
 # Register bit fields
 INTERRUPT_GEN_ISR_INTERRUPT1_B = 0
 INTERRUPT_GEN_ISR_INTERRUPT1_W = 1
@@ -60,7 +74,44 @@ LOW, HIGH = bool(0), bool(1)
 
 
 @block
-def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map_base):
+def period_counter(clk, period, counter, expired):
+    """
+    Parameters:
+    clk         Clock
+    period      Counter period, set to 0 to hold the counter at zero
+    counter     Counts from 0 to period - 1 and wraps
+    expired     High while counter is at period - 1 of a non-zero period
+    """
+    # Shared by the expiry compare and the wrap of the counter
+    period_m1 = Signal(modbv(0)[len(period):])
+
+    @always_comb
+    def decrement():
+        period_m1.next = period - 1
+
+    @always_comb
+    def expiry():
+        expired.next = period != 0 and counter >= period_m1
+
+    # No reset needed: a reset clears the period, which holds the counter
+    # at zero
+    @always(clk.posedge)
+    def count():
+        if period == 0 or expired:
+            counter.next = 0
+        else:
+            counter.next = counter + 1
+
+    return instances()
+
+
+@block
+def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map_base,
+                  isr_bits=(INTERRUPT_GEN_ISR_INTERRUPT1_B, INTERRUPT_GEN_ISR_INTERRUPT2_B),
+                  ier_bits=(INTERRUPT_GEN_IER_INTERRUPT1_B, INTERRUPT_GEN_IER_INTERRUPT2_B),
+                  trigger_bits=(INTERRUPT_GEN_TRIGGER_INTERRUPT1_B,
+                                INTERRUPT_GEN_TRIGGER_INTERRUPT2_B),
+                  rdata_valid=None):
     """
     Parameters:
     clk         Clock
@@ -70,6 +121,10 @@ def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map
     interrupt1_out  Goes high if interrupt 1 is asserted and bit in IER is set
     interrupt2_out  Goes high if interrupt 2 is asserted and bit in IER is set
     map_base    Base address
+    isr_bits    Bit position of each interrupt in INTERRUPT_GEN_ISR
+    ier_bits    Bit position of each interrupt in INTERRUPT_GEN_IER
+    trigger_bits    Bit position of each interrupt in INTERRUPT_GEN_TRIGGER
+    rdata_valid Optional output, high when the read address falls in this block's range
 
     Registers:
     INTERRUPT_GEN_PERIOD1   Divisor from clk to generate periodic interrupt 1, set to 0 for no periodic interrupts
@@ -91,43 +146,31 @@ def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map
     INTERRUPT_GEN_TRIGGER_INTERRUPT1 Triggers interrupt 1
     INTERRUPT_GEN_TRIGGER_INTERRUPT2 Triggers interrupt 2
     """
-    # Addresses of registers in block (in units of 4 bytes)
-    interrupt_gen_period1_addr = map_base + INTERRUPT_GEN_PERIOD1
-    interrupt_gen_period2_addr = map_base + INTERRUPT_GEN_PERIOD2
-    interrupt_gen_isr_addr = map_base + INTERRUPT_GEN_ISR
-    interrupt_gen_ier_addr = map_base + INTERRUPT_GEN_IER
-    interrupt_gen_trigger_addr = map_base + INTERRUPT_GEN_TRIGGER
+    num_interrupts = INTERRUPT_GEN_NUM_INTERRUPTS
+
     rdata = Signal(intbv(0)[32:])
-    period1 = Signal(intbv(0)[PL_REG_WIDTH:])
-    period2 = Signal(intbv(0)[PL_REG_WIDTH:])
+    if rdata_valid is None:
+        rdata_valid = Signal(LOW)
+    period = [Signal(intbv(0)[PL_REG_WIDTH:]) for _ in range(num_interrupts)]
     isr = Signal(intbv(0)[8:])
     ier = Signal(intbv(0)[8:])
     trigger = Signal(intbv(0)[8:])
 
-    # Unpacking ier register
-
-    ier_interrupt1 = Signal(LOW)
-    ier_interrupt2 = Signal(LOW)
-
-    @always_comb
-    def unpack_ier():
-        ier_interrupt1.next = ier[INTERRUPT_GEN_IER_INTERRUPT1_B]
-        ier_interrupt2.next = ier[INTERRUPT_GEN_IER_INTERRUPT2_B]
-
-    # Unpacking trigger register
-
-    trigger_interrupt1 = Signal(LOW)
-    trigger_interrupt2 = Signal(LOW)
-
-    @always_comb
-    def unpack_trigger():
-        trigger_interrupt1.next = trigger[INTERRUPT_GEN_TRIGGER_INTERRUPT1_B]
-        trigger_interrupt2.next = trigger[INTERRUPT_GEN_TRIGGER_INTERRUPT2_B]
+    # Per interrupt views of the isr, ier and trigger registers, bit i of
+    # each view is the field of interrupt i
+    isr_interrupt = ConcatSignal(*[isr(b) for b in reversed(isr_bits)])
+    ier_interrupt = ConcatSignal(*[ier(b) for b in reversed(ier_bits)])
+    trigger_interrupt = ConcatSignal(*[trigger(b) for b in reversed(trigger_bits)])
 
     # User defined signals and variables
     # Counters for periodic interrupts
-    period1_counter = Signal(modbv(0)[PL_REG_WIDTH:])
-    period2_counter = Signal(modbv(0)[PL_REG_WIDTH:])
+    period_count = [Signal(modbv(0)[PL_REG_WIDTH:]) for _ in range(num_interrupts)]
+    period_expired = [Signal(LOW) for _ in range(num_interrupts)]
+    period_counters = [
+        period_counter(clk, period[i], period_count[i], period_expired[i])
+        for i in range(num_interrupts)
+    ]
+    expired = ConcatSignal(*reversed(period_expired))
 
     # AxiLocal pass through logic
     if axi_m is not None:
@@ -139,7 +182,12 @@ def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map
             axi_m.wdata.next = axi_s.wdata
             axi_m.wstrobe.next = axi_s.wstrobe
             axi_m.wen.next = axi_s.wen
-            axi_s.rdata.next = axi_m.rdata | rdata
+            # Select rather than OR the downstream read data, only one block
+            # in the chain decodes a given read address
+            if rdata_valid:
+                axi_s.rdata.next = rdata
+            else:
+                axi_s.rdata.next = axi_m.rdata
 
     else:
 
@@ -147,144 +195,90 @@ def interrupt_gen(clk, resetn, axi_s, axi_m, interrupt1_out, interrupt2_out, map
         def axi_passthrough():
             axi_s.rdata.next = rdata
 
-    @always_comb
-    def register_read():
-        # Read access of registers
-        rdata.next = 0
-        if axi_s.raddr == interrupt_gen_period1_addr:
-            rdata.next = period1
-        elif axi_s.raddr == interrupt_gen_period2_addr:
-            rdata.next = period2
-        elif axi_s.raddr == interrupt_gen_isr_addr:
-            rdata.next = isr
-        elif axi_s.raddr == interrupt_gen_ier_addr:
-            rdata.next = ier
-
-    period1_write_decode = Signal(LOW)
+    # Interrupt events setting bits in the ISR
+    interrupt_event = Signal(intbv(0)[num_interrupts:])
 
     @always_comb
-    def period1_write_decoder():
-        period1_write_decode.next = (
-            axi_s.wen and axi_s.waddr == interrupt_gen_period1_addr
-        )
-
-
-    @always_seq(clk.posedge, reset=resetn)
-    def period1_write():
-        if period1_write_decode:
-            for byte_index in range((PL_REG_WIDTH + 7) // 8):
-                if axi_s.wstrobe[byte_index]:
-                    for bit_index in range(8):
-                        bit = 8 * byte_index + bit_index
-                        if bit < len(period1):
-                            period1.next[bit] = axi_s.wdata[bit]
-
-    period2_write_decode = Signal(LOW)
+    def interrupt_events():
+        interrupt_event.next = expired | trigger_interrupt
+
+    isr_set = ConcatSignal(*[
+        interrupt_event(isr_bits.index(b)) if b in isr_bits else LOW
+        for b in reversed(range(len(isr)))
+    ])
+
+    # Register file: (register index, register, write semantic, kind argument)
+    regs = [(INTERRUPT_GEN_PERIOD1 + i, period[i], REG_RW, None)
+            for i in range(num_interrupts)]
+    regs += [
+        (INTERRUPT_GEN_ISR, isr, REG_W1C, isr_set),
+        (INTERRUPT_GEN_IER, ier, REG_RW, None),
+        (INTERRUPT_GEN_TRIGGER, trigger, REG_WO_AUTOCLEAR, sum(1 << b for b in trigger_bits)),
+    ]
+
+    # Read access of registers, write-only registers read as zero
+    readable = [(index, reg) for index, reg, kind, _ in regs if kind != REG_WO_AUTOCLEAR]
+    read_data = [Signal(intbv(0)[32:]) for _ in readable]
+    num_read = len(read_data)
+
+    # One-hot read decode of the register addressed in this block, a single
+    # subtract and range check instead of an address compare per register
+    read_decode = Signal(intbv(0)[INTERRUPT_GEN_NUM_REGS:])
 
     @always_comb
-    def period2_write_decoder():
-        period2_write_decode.next = (
-            axi_s.wen and axi_s.waddr == interrupt_gen_period2_addr
-        )
-
-    @always_seq(clk.posedge, reset=resetn)
-    def period2_write():
-        if period2_write_decode:
-            for byte_index in range((PL_REG_WIDTH + 7) // 8):
-                if axi_s.wstrobe[byte_index]:
-                    for bit_index in range(8):
-                        bit = 8 * byte_index + bit_index
-                        if bit < len(period2):
-                            period2.next[bit] = axi_s.wdata[bit]
-
-    isr_write_decode = Signal(LOW)
+    def read_decoder():
+        read_decode.next = 0
+        rdata_valid.next = 0
+        if axi_s.raddr >= map_base and axi_s.raddr < map_base + INTERRUPT_GEN_NUM_REGS:
+            read_decode.next = 1 << (axi_s.raddr - map_base)
+            rdata_valid.next = 1
+
+    register_reads = [
+        register_read(read_decode(index), reg, data)
+        for (index, reg), data in zip(readable, read_data)
+    ]
 
     @always_comb
-    def isr_write_decoder():
-        isr_write_decode.next = axi_s.wen and axi_s.waddr == interrupt_gen_isr_addr
-
-    @always_seq(clk.posedge, reset=resetn)
-    def isr_write():
-        if isr_write_decode:
-            for byte_index in range((8 + 7) // 8):
-                if axi_s.wstrobe[byte_index]:
-                    for bit_index in range(8):
-                        bit = 8 * byte_index + bit_index
-                        if bit < len(isr):
-                            isr.next[bit] = isr[bit] & (~axi_s.wdata[bit])
+    def read_mux():
+        value = intbv(0)[32:]
+        for i in range(num_read):
+            value[:] = value | read_data[i]
+        rdata.next = value
 
-        if (period1 != 0 and period1_counter >= period1 - 1) or trigger_interrupt1:
-            isr.next[INTERRUPT_GEN_ISR_INTERRUPT1_B] = HIGH
-
-        if (period2 != 0 and period2_counter >= period2 - 1) or trigger_interrupt2:
-            isr.next[INTERRUPT_GEN_ISR_INTERRUPT2_B] = HIGH
-
-    ier_write_decode = Signal(LOW)
+    # Expand byte-lane write strobes into a per-bit write mask
+    wstrobe_mask = Signal(modbv(0)[PL_DATA_WIDTH:])
 
     @always_comb
-    def ier_write_decoder():
-        ier_write_decode.next = axi_s.wen and axi_s.waddr == interrupt_gen_ier_addr
-
-    @always_seq(clk.posedge, reset=resetn)
-    def ier_write():
-        if ier_write_decode:
-            for byte_index in range((8 + 7) // 8):
-                if axi_s.wstrobe[byte_index]:
-                    for bit_index in range(8):
-                        bit = 8 * byte_index + bit_index
-                        if bit < len(ier):
-                            ier.next[bit] = axi_s.wdata[bit]
+    def expand_wstrobe():
+        for bit_index in range(PL_DATA_WIDTH):
+            wstrobe_mask.next[bit_index] = axi_s.wstrobe[bit_index // 8]
 
-    trigger_write_decode = Signal(LOW)
+    # One-hot write decode of the register addressed in this block
+    write_decode = Signal(intbv(0)[INTERRUPT_GEN_NUM_REGS:])
 
     @always_comb
-    def trigger_write_decoder():
-        trigger_write_decode.next = (
-            axi_s.wen and axi_s.waddr == interrupt_gen_trigger_addr
-        )
-
-    @always_seq(clk.posedge, reset=resetn)
-    def trigger_write():
-        if trigger_write_decode:
-            for byte_index in range((8 + 7) // 8):
-                if axi_s.wstrobe[byte_index]:
-                    for bit_index in range(8):
-                        bit = 8 * byte_index + bit_index
-                        if bit < len(trigger):
-                            trigger.next[bit] = axi_s.wdata[bit]
-        else:
-            if trigger_interrupt1:
-                trigger.next[INTERRUPT_GEN_TRIGGER_INTERRUPT1_B] = LOW
-            if trigger_interrupt2:
-                trigger.next[INTERRUPT_GEN_TRIGGER_INTERRUPT2_B] = LOW
-
-    @always_seq(clk.posedge, reset=resetn)
-    def handle_period1_counter():
-        if period1 == 0:
-            period1_counter.next = 0
-        elif period1_counter >= period1 - 1:
-            period1_counter.next = 0
-        else:
-            period1_counter.next = period1_counter + 1
-
-    @always_seq(clk.posedge, reset=resetn)
-    def handle_period2_counter():
-        if period2 == 0:
-            period2_counter.next = 0
-        elif period2_counter >= period2 - 1:
-            period2_counter.next = 0
-        else:
-            period2_counter.next = period2_counter + 1
-
-
+    def write_decoder():
+        write_decode.next = 0
+        if (axi_s.wen and axi_s.waddr >= map_base
+                and axi_s.waddr < map_base + INTERRUPT_GEN_NUM_REGS):
+            write_decode.next = 1 << (axi_s.waddr - map_base)
+
+    register_writes = [
+        register_write(clk, resetn, write_decode(index), axi_s.wdata, wstrobe_mask,
+                       reg, kind, aux)
+        for index, reg, kind, aux in regs
+    ]
+
+    # Interrupt outputs, bit i of active is interrupt i
     @always_comb
     def assigninterrupt_out():
-        interrupt1_out.next = ier_interrupt1 and isr[INTERRUPT_GEN_ISR_INTERRUPT1_B]
-        interrupt2_out.next = ier_interrupt2 and isr[INTERRUPT_GEN_ISR_INTERRUPT2_B]
+        active = intbv(0)[num_interrupts:]
+        active[:] = ier_interrupt & isr_interrupt
+        interrupt1_out.next = active[0]
+        interrupt2_out.next = active[1]
 
     return instances()
 
-
 if __name__ == "__main__":
     # Define signals for block ports
     clk = Signal(LOW)
@@ -295,6 +289,8 @@ if __name__ == "__main__":
     interrupt2_out = Signal(LOW)
     map_base = 0
 
-    interrupt_gen(clk=clk, resetn=resetn, axi_s=axi_s, axi_m=axi_m,
-                  interrupt1_out=interrupt1_out,
-                  interrupt2_out=interrupt2_out, map_base=map_base).convert(hdl='Verilog')
+    convert_cached(interrupt_gen,
+                   dict(clk=clk, resetn=resetn, axi_s=axi_s, axi_m=axi_m,
+                        interrupt1_out=interrupt1_out,
+                        interrupt2_out=interrupt2_out, map_base=map_base),
+                   params=(PL_ADDR_WIDTH, PL_DATA_WIDTH, map_base))
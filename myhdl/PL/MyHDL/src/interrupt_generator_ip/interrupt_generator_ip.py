@@ -1,13 +1,13 @@
 #!/usr/bin/python
 
 from myhdl import (
-    always_comb,
     block,
     instances,
     ResetSignal,
     Signal,
 )
 
+from PL.MyHDL.src.build_support.convert_cache import convert_cached
 from PL.MyHDL.src.interfaces.axi_lite import AxiLite
 from PL.MyHDL.src.interfaces.axi_local import AxiLocal
 from PL.MyHDL.src.axi_support.axi_support import axi_connect
@@ -35,36 +35,10 @@ def interrupt_generator_ip(
     interrupt1_out  Interrupt 1 output
     interrupt2_out  Interrupt 2 output
     """
-    # Wrapped interface signal definitions
-    _s00_axi = AxiLite(PL_ADDR_WIDTH, PL_DATA_WIDTH)
-
-    @always_comb
-    def wrap_interfaces():
-        _s00_axi.awaddr.next = s00_axi.awaddr
-        _s00_axi.awprot.next = s00_axi.awprot
-        _s00_axi.awvalid.next = s00_axi.awvalid
-        s00_axi.awready.next = _s00_axi.awready
-        _s00_axi.wdata.next = s00_axi.wdata
-        _s00_axi.wstrb.next = s00_axi.wstrb
-        _s00_axi.wvalid.next = s00_axi.wvalid
-        s00_axi.wready.next = _s00_axi.wready
-        s00_axi.bresp.next = _s00_axi.bresp
-        s00_axi.bvalid.next = _s00_axi.bvalid
-        _s00_axi.bready.next = s00_axi.bready
-        _s00_axi.araddr.next = s00_axi.araddr
-        _s00_axi.arprot.next = s00_axi.arprot
-        _s00_axi.arvalid.next = s00_axi.arvalid
-        s00_axi.arready.next = _s00_axi.arready
-        s00_axi.rdata.next = _s00_axi.rdata
-        s00_axi.rresp.next = _s00_axi.rresp
-        s00_axi.rvalid.next = _s00_axi.rvalid
-        _s00_axi.rready.next = s00_axi.rready
-        return
-
     # Define AxiLocal daisy-chain
     axi_local1 = AxiLocal(PL_ADDR_WIDTH, PL_DATA_WIDTH)
 
-    axi_connect_inst = axi_connect(clk, resetn, _s00_axi, axi_local1)
+    axi_connect_inst = axi_connect(clk, resetn, s00_axi, axi_local1)
 
     interrupt_gen_inst = interrupt_gen(
         clk=clk,
@@ -88,10 +62,16 @@ if __name__ == "__main__":
     interrupt1_out = Signal(LOW)
     interrupt2_out = Signal(LOW)
 
-    interrupt_generator_ip(
-        clk=clk,
-        resetn=resetn,
-        s00_axi=s00_axi,
-        interrupt1_out=interrupt1_out,
-        interrupt2_out=interrupt2_out,
-    ).convert(hdl="Verilog", testbench=False, timescale="1ns/1ps")
+    convert_cached(
+        interrupt_generator_ip,
+        dict(
+            clk=clk,
+            resetn=resetn,
+            s00_axi=s00_axi,
+            interrupt1_out=interrupt1_out,
+            interrupt2_out=interrupt2_out,
+        ),
+        params=(PL_ADDR_WIDTH, PL_DATA_WIDTH, PL_INTERRUPT_GENERATOR),
+        testbench=False,
+        timescale="1ns/1ps",
+    )
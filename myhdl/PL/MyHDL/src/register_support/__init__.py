@@ -0,0 +1 @@
+# Register support package
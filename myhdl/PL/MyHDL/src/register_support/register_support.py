@@ -0,0 +1,83 @@
+#!/usr/bin/python
+#
+# FILE:
+#   register_support.py
+#
+# DESCRIPTION:
+#   Support blocks which build a block's register file from a table of
+#   register descriptors on the AxiLocal bus
+#
+from myhdl import (always_comb, always_seq, block, intbv)
+
+# Register write semantics
+REG_RW = "rw"                       # Read/write
+REG_W1C = "w1c"                     # Read, write 1 to clear, set by hardware
+REG_WO_AUTOCLEAR = "wo_autoclear"   # Write-only, bits self-clear after one cycle
+
+
+@block
+def register_write(clk, resetn, write, wdata, wmask, reg, kind, aux=None):
+    """
+    Parameters:
+    clk     Clock
+    resetn  Reset
+    write   Write strobe for this register
+    wdata   Write data
+    wmask   Per-bit write mask
+    reg     Register to update
+    kind    Write semantic, one of REG_RW, REG_W1C and REG_WO_AUTOCLEAR
+    aux     REG_W1C: signal of bits set by hardware, these win over a clear
+            REG_WO_AUTOCLEAR: mask of bits cleared in every cycle they are not written
+    """
+    width = len(reg)
+
+    if kind == REG_RW:
+
+        @always_seq(clk.posedge, reset=resetn)
+        def write_reg():
+            if write:
+                reg.next = (reg & ~wmask[width:]) | (wdata[width:] & wmask[width:])
+
+    elif kind == REG_W1C:
+
+        @always_seq(clk.posedge, reset=resetn)
+        def write_reg():
+            if write:
+                reg.next = (reg & ~(wdata[width:] & wmask[width:])) | aux
+            else:
+                reg.next = reg | aux
+
+    elif kind == REG_WO_AUTOCLEAR:
+        keep_mask = ((1 << width) - 1) & ~aux
+
+        # Auto-clear bits unconditionally and merge the write through the
+        # write-gated mask, a single masked update per bit
+        @always_seq(clk.posedge, reset=resetn)
+        def write_reg():
+            mask = intbv(0)[width:]
+            if write:
+                mask[:] = wmask[width:]
+            reg.next = (reg & keep_mask & ~mask) | (wdata[width:] & mask)
+
+    else:
+        raise ValueError("Unknown register kind %r" % (kind,))
+
+    return write_reg
+
+
+@block
+def register_read(read, reg, rdata):
+    """
+    Parameters:
+    read    Read select for this register
+    reg     Register to read
+    rdata   Register value when read is set, zero otherwise
+    """
+
+    @always_comb
+    def read_reg():
+        rdata.next = 0
+        if read:
+            rdata.next = reg
+
+    return read_reg